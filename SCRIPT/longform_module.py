@@ -1,8 +1,7 @@
 import os
 import sys
-import io
 import logging
-import time
+import threading
 from typing import Callable, Optional, Union, List, Iterable
 
 # Windows-specific setup for PyTorch audio
@@ -11,17 +10,15 @@ if os.name == "nt" and (3, 8) <= sys.version_info < (3, 99):
     _init_dll_path()
 
 # Fix console encoding for Windows to properly display Greek characters
-if os.name == "nt":
-    # Force UTF-8 encoding for stdout
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+if os.name == "nt" and hasattr(sys.stdout, "reconfigure"):
+    # Force UTF-8 encoding for stdout, keeping the existing stream
+    sys.stdout.reconfigure(encoding='utf-8')
 
 # Import Rich for better terminal display with Unicode support
 try:
     from rich.console import Console
     from rich.text import Text
     from rich.panel import Panel
-    from rich.live import Live
-    from rich.spinner import Spinner
     console = Console()
     has_rich = True
 except ImportError:
@@ -85,6 +82,7 @@ class LongFormTranscriber:
         """
         self.recording = False
         self.running = False
+        self._quit_event = threading.Event()
         self.last_transcription = ""
 
         # Store preinitialized model if provided
@@ -267,6 +265,7 @@ class LongFormTranscriber:
         Stop the transcription process and exit.
         """
         self.running = False
+        self._quit_event.set()
         if self.recording and self.recorder:
             self.stop_recording()
         
@@ -288,6 +287,7 @@ class LongFormTranscriber:
         Start the long-form transcription process.
         """
         self.running = True
+        self._quit_event.clear()
 
         # Show instructions (without hotkey references)
         if has_rich:
@@ -297,35 +297,11 @@ class LongFormTranscriber:
             print("Long-Form Speech Transcription")
             print("Ready for transcription")
 
-        # Keep the program running until quit
+        # Block until quit() is called; the timeout only keeps Ctrl+C
+        # responsive on Windows, where an untimed wait can't be interrupted
         try:
-            while self.running:
-                time.sleep(0.1)  # Sleep to avoid high CPU usage
-        except KeyboardInterrupt:
-            self.quit()
-        
-        # Show instructions
-        if has_rich:
-            console.print("[bold]Long-Form Speech Transcription[/bold]")
-            if self.start_hotkey:
-                console.print(f"Press [bold green]{self.start_hotkey}[/bold green] to start recording")
-            if self.stop_hotkey:
-                console.print(f"Press [bold yellow]{self.stop_hotkey}[/bold yellow] to stop recording and transcribe")
-            if self.quit_hotkey:
-                console.print(f"Press [bold red]{self.quit_hotkey}[/bold red] to quit")
-        else:
-            print("Long-Form Speech Transcription")
-            if self.start_hotkey:
-                print(f"Press {self.start_hotkey} to start recording")
-            if self.stop_hotkey:
-                print(f"Press {self.stop_hotkey} to stop recording and transcribe")
-            if self.quit_hotkey:
-                print(f"Press {self.quit_hotkey} to quit")
-        
-        # Keep the program running until quit
-        try:
-            while self.running:
-                time.sleep(0.1)  # Sleep to avoid high CPU usage
+            while not self._quit_event.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             self.quit()
     
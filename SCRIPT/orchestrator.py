@@ -23,41 +23,79 @@
 
 import os
 import sys
+import asyncio
 import socket
 import threading
 import time
 import logging
-from typing import Optional, Dict, Any
+import logging.handlers
+import queue
+import functools
+from enum import IntEnum
 import importlib.util
 import subprocess
+import shutil
 import signal
 import atexit
 import io
-import psutil
 
-# Configure logging to file only (not to console)
+def lazy_import(name):
+    """Import a module whose body only runs on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# Only needed when managing the AutoHotkey process
+psutil = lazy_import("psutil")
+
+# Configure logging to file only (not to console). Records are formatted by
+# the caller and written to disk by a listener thread, so logging never blocks
+# the server or the transcription worker on file I/O.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("stt_orchestrator.log"),
+    respect_handler_level=True,
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("stt_orchestrator.log"),
+        logging.handlers.QueueHandler(_log_queue),
     ]
 )
 
-# Console output with color support
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
-    console = Console()
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
-    console = None
+# Console output with color support (Rich is imported on first use)
+HAS_RICH = importlib.util.find_spec("rich") is not None
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Return the shared Rich console, or None if Rich is not available."""
+    try:
+        from rich.console import Console
+    except ImportError:
+        return None
+    return Console()
 
 # TCP server settings
 SERVER_HOST = '127.0.0.1'
 SERVER_PORT = 35000
+# Listen backlog; the event loop also accepts up to this many queued
+# connections per wakeup, so a burst of hotkeys is drained in one pass
+SERVER_BACKLOG = 32
 
 # Module paths
 MODULE_PATHS = {
@@ -66,11 +104,80 @@ MODULE_PATHS = {
     "static": "static_module.py"
 }
 
-def safe_print(message):
+# Package-like prefix for the modules in sys.modules, so short names such as
+# "static" can't shadow (or be shadowed by) an unrelated installed package
+MODULE_NAMESPACE = "_stt_orchestrator"
+
+def _qualified_name(module_name):
+    """Return the sys.modules key for one of the transcription modules."""
+    return f"{MODULE_NAMESPACE}.{module_name}"
+
+# AutoHotkey interpreter process name
+AHK_EXE_NAME = 'AutoHotkeyU64.exe'
+
+# Win32 process snapshot API, used to find AHK processes without opening
+# a handle to every process on the system
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_void_p),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+        ]
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32FirstW.restype = wintypes.BOOL
+    _kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32NextW.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+@functools.lru_cache(maxsize=1)
+def _startup_banner():
+    """Build the Rich startup banner once."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
+        Text.from_markup(
+            "[bold]Speech-to-Text Orchestrator[/bold]\n\n"
+            "Control the system using these hotkeys:\n"
+            "  [cyan]F1[/cyan]:  Open configuration dialogue box\n"
+            "  [cyan]F2[/cyan]:  Toggle real-time transcription\n"
+            "  [cyan]F3[/cyan]:  Start long-form recording\n"
+            "  [cyan]F4[/cyan]:  Stop long-form recording and transcribe\n"
+            "  [cyan]F10[/cyan]: Run static file transcription\n"
+            "  [cyan]F7[/cyan]:  Quit application"
+        ),
+        title="Speech-to-Text System",
+        border_style="green"
+    )
+
+def safe_print(message, markup: bool = False):
     """Print function that handles I/O errors gracefully."""
     try:
-        if HAS_RICH:
+        console = _get_console() if HAS_RICH else None
+        if console and markup:
             console.print(message)
+        elif console:
+            # Plain messages skip Rich's markup parsing and highlighting
+            console.print(message, markup=False, highlight=False, soft_wrap=True)
         else:
             print(message)
     except ValueError as e:
@@ -80,37 +187,157 @@ def safe_print(message):
             # For other ValueErrors, log them
             logging.error(f"Error in safe_print: {e}")
 
+@functools.lru_cache(maxsize=None)
+def _spec_for(module_name, filepath):
+    """Return the import spec for a module file, or None if it doesn't exist."""
+    if not os.path.exists(filepath):
+        return None
+    return importlib.util.spec_from_file_location(module_name, filepath)
+
+def _find_ahk_exe():
+    """Return the path of the AutoHotkey interpreter, or None if it can't be found."""
+    ahk_exe = shutil.which(AHK_EXE_NAME)
+    if ahk_exe:
+        return ahk_exe
+
+    # Default install location of AutoHotkey
+    default_path = os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"), "AutoHotkey", AHK_EXE_NAME)
+    if os.path.exists(default_path):
+        return default_path
+    return None
+
+def _snapshot_ahk_pids():
+    """Return AHK PIDs from a single Win32 process snapshot."""
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    pids = set()
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile == AHK_EXE_NAME:
+                pids.add(entry.th32ProcessID)
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+    return pids
+
+def _ahk_pids():
+    """Return the PIDs of all running AutoHotkey interpreter processes."""
+    if os.name == "nt":
+        try:
+            # A single snapshot only reads the executable names
+            return _snapshot_ahk_pids()
+        except OSError as e:
+            logging.error(f"Process snapshot failed, falling back to psutil: {e}")
+
+    # Only request the name so psutil doesn't query anything else per process
+    return {
+        proc.info['pid']
+        for proc in psutil.process_iter(['pid', 'name'])
+        if proc.info['name'] == AHK_EXE_NAME
+    }
+
+class Mode(IntEnum):
+    """Transcription mode the orchestrator is currently in."""
+    IDLE = 0
+    REALTIME = 1
+    LONGFORM = 2
+    STATIC = 3
+
 class STTOrchestrator:
     """
     Main orchestrator for the Speech-to-Text system.
     Coordinates between different transcription modes and handles hotkey commands.
     """
+
+    __slots__ = (
+        "script_dir", "config_path", "_ahk_path", "_module_files",
+        "current_loaded_model_type", "running", "_stop_event", "_loop",
+        "_shutdown", "_command_lock", "_mode", "_mode_lock", "ahk_proc",
+        "_ahk_via_shell",
+        "_worker", "_sessions", "loaded_models", "config", "modules", "transcribers",
+        "_commands",
+    )
     
     def __init__(self):
         """Initialize the orchestrator."""
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_path = os.path.join(self.script_dir, "config.json")
+        self._ahk_path = os.path.join(self.script_dir, "STT_hotkeys.ahk")
+        self._module_files = {
+            name: os.path.join(self.script_dir, filename)
+            for name, filename in MODULE_PATHS.items()
+        }
         self.current_loaded_model_type = None
         
         # Application state
         self.running = False
-        self.server_thread = None
-        self.current_mode = None  # Can be "realtime", "longform", or "static"
-        self.ahk_pid = None
+        self._stop_event = threading.Event()
+        self._loop = None
+        self._shutdown = None
+        self._command_lock = None
+        self._mode = Mode.IDLE
+        self._mode_lock = threading.Lock()
+        self.ahk_proc = None
+        self._ahk_via_shell = False  # Launched through the file association, PID unknown
+
+        # Single daemon worker that runs the real-time and static transcription
+        # sessions one after another; a daemon so exit never waits on a session
+        self._sessions = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._session_loop, name="stt-worker", daemon=True)
+        self._worker.start()
 
         # Track loaded models
         self.loaded_models = {}
 
         # Initialize configuration
         self._load_or_create_config()
+
+        # Report missing module files at startup rather than on the first hotkey
+        for name, filepath in self._module_files.items():
+            if not os.path.exists(filepath):
+                self.log_error(f"Module file for {name} not found: {filepath}")
         
         # Module information - we'll import modules lazily
         self.modules = {}
         self.transcribers = {}
+
+        # Command handlers, keyed by the strings AutoHotkey sends
+        self._commands = {
+            "OPEN_CONFIG": self._open_config_dialog,
+            "TOGGLE_REALTIME": self._toggle_realtime,
+            "START_LONGFORM": self._start_longform,
+            "STOP_LONGFORM": self._stop_longform,
+            "RUN_STATIC": self._run_static,
+            "QUIT": self._quit,
+        }
         
         # Register cleanup handler
         atexit.register(self.stop)
 
+    @property
+    def current_mode(self):
+        """Name of the active mode ("realtime", "longform" or "static"), or None."""
+        mode = self._mode
+        return None if mode == Mode.IDLE else mode.name.lower()
+
+    def _set_mode(self, new, expected=None):
+        """Switch to a new mode, only if the current mode is `expected` when given."""
+        with self._mode_lock:
+            if expected is not None and self._mode != expected:
+                return False
+            self._mode = new
+            return True
+
+    def _try_enter(self, mode):
+        """Enter a mode if no other mode is active. Returns False otherwise."""
+        return self._set_mode(mode, expected=Mode.IDLE)
+
     def _load_or_create_config(self):
         """Load configuration from file or create it if it doesn't exist."""
         import json
@@ -125,7 +352,7 @@ class STTOrchestrator:
                 "input_device_index": None,
                 "gpu_device_index": 0,
                 "silero_sensitivity": 0.4,
-                "silero_use_onnx": False,
+                "silero_use_onnx": True,
                 "silero_deactivity_detection": False,
                 "webrtc_sensitivity": 3,
                 "post_speech_silence_duration": 0.6,
@@ -136,7 +363,8 @@ class STTOrchestrator:
                 "ensure_sentence_ends_with_period": True,
                 "batch_size": 16,
                 "beam_size": 5,
-                "beam_size_realtime": 3,
+                "beam_size_realtime": 1,
+                "use_main_model_for_realtime": False,
                 "initial_prompt": None,
                 "allowed_latency_limit": 100,
                 "early_transcription_on_silence": 0,
@@ -219,16 +447,15 @@ class STTOrchestrator:
         safe_print("Opening configuration dialog...")
         
         # Check if any transcription is active
-        if self.current_mode:
+        if self._mode != Mode.IDLE:
             safe_print(f"Warning: Transcription in {self.current_mode} mode is active.")
             # We'll still allow opening the dialog, but warn the user
         
         # Import the configuration dialog module
         try:
             # Add the script directory to sys.path if it's not already there
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            if script_dir not in sys.path:
-                sys.path.append(script_dir)
+            if self.script_dir not in sys.path:
+                sys.path.append(self.script_dir)
                 
             from configuration_dialog_box_module import ConfigurationDialog
             
@@ -256,32 +483,39 @@ class STTOrchestrator:
         self.config = new_config
         
         # If any transcribers are active, inform the user about restart
-        if self.current_mode:
+        if self._mode != Mode.IDLE:
             safe_print("Configuration updated. Changes will take effect after restarting transcribers.")
         else:
             safe_print("Configuration updated successfully.")
 
     def import_module_lazily(self, module_name):
         """Import a module only when needed."""
-        if module_name in self.modules and self.modules[module_name]:
-            return self.modules[module_name]
+        module = self.modules.get(module_name)
+        if module:
+            return module
             
-        filepath = os.path.join(self.script_dir, MODULE_PATHS.get(module_name, ""))
+        filepath = self._module_files.get(module_name)
+        if filepath is None:
+            self.log_error(f"Unknown module: {module_name}")
+            return None
         
+        qualified_name = _qualified_name(module_name)
         try:
-            # First check if the file exists
-            if not os.path.exists(filepath):
-                self.log_error(f"Module file not found: {filepath}")
-                return None
-                
-            spec = importlib.util.spec_from_file_location(module_name, filepath)
+            spec = _spec_for(qualified_name, filepath)
             if spec is None:
                 self.log_error(f"Could not find module: {module_name} at {filepath}")
                 return None
                 
+            # Run the module body right away; initialize_transcriber needs its
+            # class immediately, so deferring it (LazyLoader) would save nothing
+            # and its first access isn't thread-safe on Python 3.11
             module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module  # Add to sys.modules to avoid import errors
-            spec.loader.exec_module(module)
+            sys.modules[qualified_name] = module  # Add to sys.modules before executing so re-imports hit the cache
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(qualified_name, None)  # Don't leave a half-imported module behind
+                raise
             
             # Store the imported module
             self.modules[module_name] = module
@@ -337,8 +571,6 @@ class STTOrchestrator:
             # Use a different initialization approach for each module type
             if module_type == "realtime":
                 safe_print(f"Initializing real-time transcriber...")
-                # Force disable real-time preview functionality
-                module_config["enable_realtime_transcription"] = False
 
                 # Pass all configuration parameters
                 self.transcribers[module_type] = module.LongFormTranscriber(
@@ -349,7 +581,10 @@ class STTOrchestrator:
                     input_device_index=module_config.get("input_device_index"),
                     gpu_device_index=module_config.get("gpu_device_index", 0),
                     silero_sensitivity=module_config.get("silero_sensitivity", 0.4),
-                    silero_use_onnx=module_config.get("silero_use_onnx", False),
+                    # ONNX VAD only pays off when Whisper has the GPU, so it's
+                    # never forced on CPU setups
+                    silero_use_onnx=(module_config.get("silero_use_onnx", True)
+                                     and module_config.get("device", "cuda") == "cuda"),
                     silero_deactivity_detection=module_config.get("silero_deactivity_detection", False),
                     webrtc_sensitivity=module_config.get("webrtc_sensitivity", 3),
                     post_speech_silence_duration=module_config.get("post_speech_silence_duration", 0.6),
@@ -360,14 +595,18 @@ class STTOrchestrator:
                     ensure_sentence_ends_with_period=module_config.get("ensure_sentence_ends_with_period", True),
                     batch_size=module_config.get("batch_size", 16),
                     beam_size=module_config.get("beam_size", 5),
-                    beam_size_realtime=module_config.get("beam_size_realtime", 3),
+                    beam_size_realtime=module_config.get("beam_size_realtime", 1),
+                    use_main_model_for_realtime=module_config.get("use_main_model_for_realtime", False),
                     initial_prompt=module_config.get("initial_prompt"),
                     allowed_latency_limit=module_config.get("allowed_latency_limit", 100),
                     early_transcription_on_silence=module_config.get("early_transcription_on_silence", 0),
-                    enable_realtime_transcription=False,
+                    enable_realtime_transcription=module_config.get("enable_realtime_transcription", True),
                     realtime_processing_pause=module_config.get("realtime_processing_pause", 0.2),
                     realtime_model_type=module_config.get("realtime_model_type", "tiny.en"),
                     realtime_batch_size=module_config.get("realtime_batch_size", 16),
+                    # Load the recorder while F2 hands the session to the worker;
+                    # start() waits for it there
+                    preload_model=True,
                     preinitialized_model=preinitialized_model  # Pass the model or flag
                 )
 
@@ -443,6 +682,9 @@ class STTOrchestrator:
                 
                 # Handle different transcribers differently with more aggressive cleanup
                 if self.current_loaded_model_type == "realtime":
+                    # A recorder still warming up would be created after we unload
+                    if hasattr(transcriber, 'wait_for_warmup'):
+                        transcriber.wait_for_warmup()
                     if hasattr(transcriber, 'recorder') and transcriber.recorder:
                         # Call shutdown explicitly to clean up multiprocessing resources
                         try:
@@ -469,6 +711,12 @@ class STTOrchestrator:
                         transcriber.recorder = None
                     
                 elif self.current_loaded_model_type == "static":
+                    # Also cancels a model load still running in the background
+                    if hasattr(transcriber, 'cleanup'):
+                        try:
+                            transcriber.cleanup()
+                        except Exception as e:
+                            self.log_error(f"Error during static transcriber cleanup: {e}")
                     if hasattr(transcriber, 'whisper_model'):
                         # Explicitly delete the model
                         del transcriber.whisper_model
@@ -511,80 +759,149 @@ class STTOrchestrator:
         """Log an error message."""
         logging.error(message)
     
-    def start_server(self):
-        """Start the TCP server to listen for commands from AutoHotkey."""
-        self.running = True
-        self.server_thread = threading.Thread(target=self._run_server, daemon=True)
-        self.server_thread.start()
-        self.log_info(f"TCP server started on {SERVER_HOST}:{SERVER_PORT}")
-    
-    def _run_server(self):
-        """Run the TCP server loop."""
+    def _create_server_socket(self):
+        """Create the listening socket for the command server."""
         server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
+        # Accepted sockets inherit these, so short commands aren't held back by Nagle
+        server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
         try:
             server_socket.bind((SERVER_HOST, SERVER_PORT))
-            server_socket.listen(5)
-            server_socket.settimeout(1)  # Allow checking self.running every second
-            
-            while self.running:
-                try:
-                    client_socket, addr = server_socket.accept()
-                    data = client_socket.recv(1024).decode('utf-8').strip()
-                    self.log_info(f"Received command: {data}")
-                    
-                    # Process command
-                    self._handle_command(data)
-                    
-                    client_socket.close()
-                except socket.timeout:
-                    continue  # Just a timeout, check self.running and continue
-                except Exception as e:
-                    self.log_error(f"Error handling client connection: {e}")
+            server_socket.listen(SERVER_BACKLOG)
+            server_socket.setblocking(False)
+        except Exception:
+            server_socket.close()
+            raise
+        return server_socket
+
+    async def _serve(self):
+        """Run the TCP server that listens for commands from AutoHotkey."""
+        try:
+            server = await asyncio.start_server(
+                self._on_client,
+                sock=self._create_server_socket(),
+                backlog=SERVER_BACKLOG
+            )
+            self.log_info(f"TCP server started on {SERVER_HOST}:{SERVER_PORT}")
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             self.log_error(f"Server error: {e}")
         finally:
-            server_socket.close()
             self.log_info("TCP server stopped")
-    
+
+    async def _on_client(self, reader, writer):
+        """Read a single command from a client connection and process it."""
+        try:
+            data = (await reader.read(1024)).decode('utf-8').strip()
+            self.log_info(f"Received command: {data}")
+
+            # Process command
+            await self._handle_command_async(data)
+        except Exception as e:
+            self.log_error(f"Error handling client connection: {e}")
+        finally:
+            writer.close()
+
+    async def _handle_command_async(self, command):
+        """Process a command off the event loop, one command at a time."""
+        async with self._command_lock:
+            # A daemon thread rather than the loop's executor, which asyncio.run()
+            # would wait for on exit (e.g. with the config dialog still open)
+            done = self._loop.create_future()
+            threading.Thread(
+                target=self._run_command, args=(command, done),
+                name="stt-command", daemon=True
+            ).start()
+            await done
+
+    def _run_command(self, command, done):
+        """Run a command on its own thread and report back to the event loop."""
+        try:
+            self._handle_command(command)
+        finally:
+            try:
+                self._loop.call_soon_threadsafe(self._complete, done)
+            except RuntimeError:
+                pass  # Loop closed while the command was running
+
+    @staticmethod
+    def _complete(future):
+        """Resolve a future unless it was cancelled in the meantime."""
+        if not future.done():
+            future.set_result(None)
+
+    async def _main(self):
+        """Serve commands on the event loop until shutdown is requested."""
+        self._loop = asyncio.get_running_loop()
+        self._shutdown = self._loop.create_future()
+        self._command_lock = asyncio.Lock()
+        self.running = True
+
+        # Signal handlers are only supported by the Unix event loops
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._request_shutdown)
+            except NotImplementedError:
+                pass
+
+        server_task = asyncio.ensure_future(self._serve())
+
+        # Launch AHK and pre-load models without blocking the server; a daemon
+        # thread rather than the loop's executor, which asyncio.run() would
+        # wait for on exit
+        threading.Thread(target=self._startup, name="stt-startup", daemon=True).start()
+
+        try:
+            await self._shutdown
+        finally:
+            server_task.cancel()
+            await asyncio.gather(server_task, return_exceptions=True)
+
+    def _request_shutdown(self):
+        """Wake up the event loop so it can exit. Safe to call from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._resolve_shutdown)
+        except RuntimeError:
+            pass  # Loop closed in the meantime
+
+    def _resolve_shutdown(self):
+        """Complete the shutdown future on the event loop thread."""
+        if self._shutdown is not None and not self._shutdown.done():
+            self._shutdown.set_result(None)
+
     def _handle_command(self, command):
         """Process commands received from AutoHotkey."""
+        handler = self._commands.get(command)
+        if handler is None:
+            self.log_error(f"Unknown command: {command}")
+            return
         try:
-            if command == "OPEN_CONFIG":
-                self._open_config_dialog()
-            elif command == "TOGGLE_REALTIME":
-                # Unload current model if it's not realtime
-                if self.current_loaded_model_type and self.current_loaded_model_type != "realtime":
-                    self._unload_current_model()
-                self._toggle_realtime()
-            elif command == "START_LONGFORM":
-                # Unload current model if it's not longform
-                if self.current_loaded_model_type and self.current_loaded_model_type != "longform":
-                    self._unload_current_model()
-                self._start_longform()
-            elif command == "STOP_LONGFORM":
-                self._stop_longform()
-            elif command == "RUN_STATIC":
-                # Unload current model if it's not static
-                if self.current_loaded_model_type and self.current_loaded_model_type != "static":
-                    self._unload_current_model()
-                self._run_static()
-            elif command == "QUIT":
-                self._quit()
-            else:
-                self.log_error(f"Unknown command: {command}")
+            handler()
         except Exception as e:
             self.log_error(f"Error handling command {command}: {e}")
     
+    def _session_loop(self):
+        """Run queued transcription sessions until a None sentinel arrives."""
+        while True:
+            session = self._sessions.get()
+            if session is None:
+                return
+            try:
+                session()
+            except Exception as e:
+                self.log_error(f"Error in transcription session: {e}")
+
     def _toggle_realtime(self):
         """Toggle real-time transcription on/off."""
-        # Check if another mode is running
-        if self.current_mode and self.current_mode != "realtime":
-            safe_print(f"Cannot start real-time mode while in {self.current_mode} mode. Please finish the current operation first.")
-            return
-
-        if self.current_mode == "realtime":
+        if self._set_mode(Mode.IDLE, expected=Mode.REALTIME):
             # Real-time transcription is already running, so stop it
             safe_print("Stopping real-time transcription...")
 
@@ -592,34 +909,39 @@ class STTOrchestrator:
                 transcriber = self.transcribers.get("realtime")
                 if transcriber:
                     transcriber.running = False
-                self.current_mode = None
                 
                 # Unload the model when turning off real-time mode
                 self._unload_current_model()
                 
             except Exception as e:
                 self.log_error(f"Error stopping real-time transcription: {e}")
-        else:
-            # Start real-time transcription
-            try:
-                # Make sure we're using the real-time model
-                if self.current_loaded_model_type != "realtime":
-                    self._unload_current_model()
-                    
-                # Initialize the real-time transcriber if not already done
-                transcriber = self.initialize_transcriber("realtime")
-                if not transcriber:
-                    safe_print("Failed to initialize real-time transcriber.")
-                    return
+            return
+
+        # Check if another mode is running
+        if not self._try_enter(Mode.REALTIME):
+            safe_print(f"Cannot start real-time mode while in {self.current_mode} mode. Please finish the current operation first.")
+            return
+
+        # Start real-time transcription
+        try:
+            # Make sure we're using the real-time model
+            if self.current_loaded_model_type != "realtime":
+                self._unload_current_model()
+                
+            # Initialize the real-time transcriber if not already done
+            transcriber = self.initialize_transcriber("realtime")
+            if not transcriber:
+                safe_print("Failed to initialize real-time transcriber.")
+                self._set_mode(Mode.IDLE)
+                return
 
-                safe_print("Starting real-time transcription...")
-                self.current_mode = "realtime"
+            safe_print("Starting real-time transcription...")
 
-                # Start real-time transcription in a separate thread
-                threading.Thread(target=self._run_realtime, daemon=True).start()
-            except Exception as e:
-                self.log_error(f"Error starting real-time transcription: {e}")
-                self.current_mode = None
+            # Run real-time transcription on the worker thread
+            self._sessions.put(self._run_realtime)
+        except Exception as e:
+            self.log_error(f"Error starting real-time transcription: {e}")
+            self._set_mode(Mode.IDLE)
     
     def _run_realtime(self):
         """Run real-time transcription in a separate thread."""
@@ -627,17 +949,17 @@ class STTOrchestrator:
             transcriber = self.transcribers.get("realtime")
             if not transcriber:
                 safe_print("Realtime transcriber not available.")
-                self.current_mode = None
+                self._set_mode(Mode.IDLE, expected=Mode.REALTIME)
                 return
                 
             # Clear any previous text
-            transcriber.text_buffer = ""
+            transcriber.clear_transcribed_text()
             
             # Start transcription
             transcriber.start()
             
             self.log_info("Real-time transcription stopped")
-            self.current_mode = None
+            self._set_mode(Mode.IDLE, expected=Mode.REALTIME)
             
         except Exception as e:
             self.log_error(f"Error in _run_realtime: {e}")
@@ -649,12 +971,12 @@ class STTOrchestrator:
             except Exception as cleanup_e:
                 self.log_error(f"Error during cleanup: {cleanup_e}")
             
-            self.current_mode = None
+            self._set_mode(Mode.IDLE, expected=Mode.REALTIME)
     
     def _start_longform(self):
         """Start long-form recording."""
         # Check if another mode is running
-        if self.current_mode:
+        if not self._try_enter(Mode.LONGFORM):
             safe_print(f"Cannot start long-form mode while in {self.current_mode} mode. Please finish the current operation first.")
             return
             
@@ -667,19 +989,19 @@ class STTOrchestrator:
             transcriber = self.initialize_transcriber("longform")
             if not transcriber:
                 safe_print("Failed to initialize long-form transcriber.")
+                self._set_mode(Mode.IDLE)
                 return
                 
             safe_print("Starting long-form recording...")
-            self.current_mode = "longform"
             transcriber.start_recording()
             
         except Exception as e:
             self.log_error(f"Error starting long-form recording: {e}")
-            self.current_mode = None
+            self._set_mode(Mode.IDLE)
     
     def _stop_longform(self):
         """Stop long-form recording and transcribe."""
-        if self.current_mode != "longform":
+        if self._mode != Mode.LONGFORM:
             safe_print("No active long-form recording to stop.")
             return
             
@@ -687,21 +1009,21 @@ class STTOrchestrator:
             transcriber = self.transcribers.get("longform")
             if not transcriber:
                 safe_print("Long-form transcriber not available.")
-                self.current_mode = None
+                self._set_mode(Mode.IDLE, expected=Mode.LONGFORM)
                 return
                 
             safe_print("Stopping long-form recording and transcribing...")
             transcriber.stop_recording()
-            self.current_mode = None
+            self._set_mode(Mode.IDLE, expected=Mode.LONGFORM)
             
         except Exception as e:
             self.log_error(f"Error stopping long-form recording: {e}")
-            self.current_mode = None
+            self._set_mode(Mode.IDLE, expected=Mode.LONGFORM)
     
     def _run_static(self):
         """Run static file transcription."""
         # Check if another mode is running
-        if self.current_mode:
+        if not self._try_enter(Mode.STATIC):
             safe_print(f"Cannot start static mode while in {self.current_mode} mode. Please finish the current operation first.")
             return
             
@@ -714,17 +1036,17 @@ class STTOrchestrator:
             transcriber = self.initialize_transcriber("static")
             if not transcriber:
                 safe_print("Failed to initialize static transcriber.")
+                self._set_mode(Mode.IDLE)
                 return
                 
             safe_print("Opening file selection dialog...")
-            self.current_mode = "static"
             
-            # Run in a separate thread to avoid blocking
-            threading.Thread(target=self._run_static_thread, daemon=True).start()
+            # Run on the worker thread to avoid blocking
+            self._sessions.put(self._run_static_thread)
             
         except Exception as e:
             self.log_error(f"Error starting static transcription: {e}")
-            self.current_mode = None
+            self._set_mode(Mode.IDLE)
     
     def _run_static_thread(self):
         """Run static transcription in a separate thread."""
@@ -732,35 +1054,36 @@ class STTOrchestrator:
             transcriber = self.transcribers.get("static")
             if not transcriber:
                 safe_print("Static transcriber not available.")
-                self.current_mode = None
+                self._set_mode(Mode.IDLE, expected=Mode.STATIC)
                 return
                 
             # Select and process the file
             transcriber.select_file()
             
-            # Wait until transcription is complete
-            while transcriber.transcribing:
-                time.sleep(0.5)
+            # Wait until transcription is complete, or we're shutting down
+            while not transcriber.done_event.wait(0.5):
+                if self._stop_event.is_set():
+                    return
                 
             self.log_info("Static file transcription completed")
-            self.current_mode = None
+            self._set_mode(Mode.IDLE, expected=Mode.STATIC)
             
         except Exception as e:
             self.log_error(f"Error in static transcription: {e}")
-            self.current_mode = None
+            self._set_mode(Mode.IDLE, expected=Mode.STATIC)
     
     def _quit(self):
         """Stop all processes and exit with improved cleanup."""
         safe_print("Quitting application...")
         
         # Make sure any active mode is stopped first
-        if self.current_mode:
-            if self.current_mode == "realtime":
-                self._toggle_realtime()  # This will stop it if running
-            elif self.current_mode == "longform":
-                self._stop_longform()
-            elif self.current_mode == "static" and hasattr(self.transcribers.get("static", None), 'request_abort'):
-                self.transcribers["static"].request_abort()
+        mode = self._mode
+        if mode == Mode.REALTIME:
+            self._toggle_realtime()  # This will stop it if running
+        elif mode == Mode.LONGFORM:
+            self._stop_longform()
+        elif mode == Mode.STATIC and hasattr(self.transcribers.get("static", None), 'request_abort'):
+            self.transcribers["static"].request_abort()
         
         # Allow time for mode to stop
         time.sleep(0.5)
@@ -770,129 +1093,118 @@ class STTOrchestrator:
         
         # Force exit after a short delay to ensure clean shutdown
         time.sleep(0.5)
+
+        # os._exit() skips atexit, so flush the queued log records ourselves
+        _log_listener.stop()
         os._exit(0)
     
     def _kill_leftover_ahk(self):
         """Kill any existing AHK processes using our script."""
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        # Only the AHK processes need their command line read
+        for pid in _ahk_pids():
             try:
-                if (
-                    proc.info['name'] == 'AutoHotkeyU64.exe'
-                    and proc.info['cmdline'] is not None
-                    and "STT_hotkeys.ahk" in ' '.join(proc.info['cmdline'])
-                ):
-                    self.log_info(f"Killing leftover AHK process with PID={proc.pid}")
-                    psutil.Process(proc.pid).kill()
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
+                proc = psutil.Process(pid)
+                if "STT_hotkeys.ahk" in ' '.join(proc.cmdline()):
+                    self.log_info(f"Killing leftover AHK process with PID={pid}")
+                    proc.kill()
+            except psutil.Error:
+                continue  # Exited or not accessible
     
     def start_ahk_script(self):
         """Start the AutoHotkey script."""
         # First kill any leftover AHK processes
         self._kill_leftover_ahk()
         
-        # Record existing AHK PIDs before launching
-        pre_pids = set()
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if proc.info['name'] == 'AutoHotkeyU64.exe':
-                    pre_pids.add(proc.info['pid'])
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        ahk_path = self._ahk_path
+        creationflags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
 
-        # Launch the AHK script
-        ahk_path = os.path.join(self.script_dir, "STT_hotkeys.ahk")
-        self.log_info("Launching AHK script...")
-        subprocess.Popen(
-            [ahk_path],
-            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
-            shell=True
-        )
-
-        # Give it a moment to start
-        time.sleep(1.0)
-        
-        # Find the new AHK process
-        post_pids = set()
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if proc.info['name'] == 'AutoHotkeyU64.exe':
-                    post_pids.add(proc.info['pid'])
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        ahk_exe = _find_ahk_exe()
+        if ahk_exe is None:
+            # Fall back to the .ahk file association; we can't track the PID then
+            self.log_error(f"{AHK_EXE_NAME} not found, launching AHK script through the shell")
+            subprocess.Popen([ahk_path], creationflags=creationflags, shell=True)
+            self.ahk_proc = None
+            self._ahk_via_shell = True
+            return
 
-        # Store the PID of the new process
-        new_pids = post_pids - pre_pids
-        if len(new_pids) == 1:
-            self.ahk_pid = new_pids.pop()
-            self.log_info(f"Detected new AHK script PID: {self.ahk_pid}")
-        else:
-            self.log_info("Could not detect a single new AHK script PID. No PID stored.")
-            self.ahk_pid = None
+        # Launch the interpreter directly so we get its PID from Popen
+        self.log_info("Launching AHK script...")
+        self.ahk_proc = subprocess.Popen([ahk_exe, ahk_path], creationflags=creationflags, shell=False)
+        self.log_info(f"Started AHK script with PID: {self.ahk_proc.pid}")
     
     def stop_ahk_script(self):
-        """Kill AHK script if we know its PID."""
-        if self.ahk_pid is not None:
-            self.log_info(f"Killing AHK script with PID={self.ahk_pid}")
+        """Stop the AHK script if we launched it and it is still running."""
+        if self._ahk_via_shell:
+            # Popen only gave us the shell, so find the interpreter by its script
+            self._ahk_via_shell = False
+            self._kill_leftover_ahk()
+            return
+
+        proc = self.ahk_proc
+        if proc is None or proc.poll() is not None:
+            return
+
+        self.log_info(f"Stopping AHK script with PID={proc.pid}")
+        try:
+            proc.terminate()
             try:
-                psutil.Process(self.ahk_pid).kill()
-            except Exception as e:
-                self.log_error(f"Failed to kill AHK process: {e}")
+                proc.wait(timeout=0.5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        except Exception as e:
+            self.log_error(f"Failed to kill AHK process: {e}")
     
-    def run(self):
-        """Run the orchestrator."""
-        # Start the TCP server
-        self.start_server()
-        
-        # Start the AutoHotkey script
-        self.start_ahk_script()
-        
-        # Pre-load the longform transcription model at startup as requested
-        safe_print("Pre-loading the long-form transcription model...")
-        longform_transcriber = self.initialize_transcriber("longform")
-        if longform_transcriber:
-            # Force complete initialization including the AudioToTextRecorder
-            if hasattr(longform_transcriber, 'force_initialize'):
-                if longform_transcriber.force_initialize():
-                    # Set the current loaded model type
-                    self.current_loaded_model_type = "longform"
-                    # Add to loaded_models dictionary
-                    self.loaded_models['longform'] = {
-                        'name': self.config['longform']['model'],
-                        'transcriber': longform_transcriber
-                    }
-                    safe_print("Long-form transcription model fully loaded and ready to use.")
+    def _startup(self):
+        """Start AutoHotkey, pre-load the long-form model and show the banner."""
+        try:
+            # Start the AutoHotkey script
+            self.start_ahk_script()
+
+            # Don't load a model if we were asked to quit in the meantime
+            if self._stop_event.is_set():
+                return
         
-        # Display startup banner
-        if HAS_RICH:
-            console.print(Panel(
-                "[bold]Speech-to-Text Orchestrator[/bold]\n\n"
-                "Control the system using these hotkeys:\n"
-                "  [cyan]F1[/cyan]:  Open configuration dialogue box\n"
-                "  [cyan]F2[/cyan]:  Toggle real-time transcription\n"
-                "  [cyan]F3[/cyan]:  Start long-form recording\n"
-                "  [cyan]F4[/cyan]:  Stop long-form recording and transcribe\n"
-                "  [cyan]F10[/cyan]: Run static file transcription\n"
-                "  [cyan]F7[/cyan]:  Quit application",
-                title="Speech-to-Text System",
-                border_style="green"
-            ))
-        else:
-            safe_print("="*50)
-            safe_print("Speech-to-Text Orchestrator Running")
-            safe_print("="*50)
-            safe_print("Hotkeys:")
-            safe_print("  F2: Toggle real-time transcription")
-            safe_print("  F3: Start long-form recording")
-            safe_print("  F4: Stop long-form recording and transcribe")
-            safe_print("  F10: Run static file transcription")
-            safe_print("  F7: Quit application")
-            safe_print("="*50)
+            # Pre-load the longform transcription model at startup as requested
+            safe_print("Pre-loading the long-form transcription model...")
+            longform_transcriber = self.initialize_transcriber("longform")
+            if longform_transcriber:
+                # Force complete initialization including the AudioToTextRecorder
+                if hasattr(longform_transcriber, 'force_initialize'):
+                    if longform_transcriber.force_initialize():
+                        # Set the current loaded model type
+                        self.current_loaded_model_type = "longform"
+                        # Add to loaded_models dictionary
+                        self.loaded_models['longform'] = {
+                            'name': self.config['longform']['model'],
+                            'transcriber': longform_transcriber
+                        }
+                        safe_print("Long-form transcription model fully loaded and ready to use.")
         
-        # Keep the main thread running
+            # Display startup banner
+            if HAS_RICH:
+                safe_print(_startup_banner())
+            else:
+                # One write to the console instead of one per line
+                safe_print("\n".join([
+                    "="*50,
+                    "Speech-to-Text Orchestrator Running",
+                    "="*50,
+                    "Hotkeys:",
+                    "  F2: Toggle real-time transcription",
+                    "  F3: Start long-form recording",
+                    "  F4: Stop long-form recording and transcribe",
+                    "  F10: Run static file transcription",
+                    "  F7: Quit application",
+                    "="*50,
+                ]))
+        except Exception as e:
+            self.log_error(f"Error during startup: {e}")
+
+    def run(self):
+        """Run the orchestrator."""
+        # Serve commands until a shutdown is requested
         try:
-            while self.running:
-                time.sleep(0.1)
+            asyncio.run(self._main())
         except KeyboardInterrupt:
             safe_print("\nKeyboard interrupt received, shutting down...")
         except Exception as e:
@@ -908,20 +1220,26 @@ class STTOrchestrator:
 
             self.log_info("Beginning graceful shutdown sequence...")
             self.running = False
+            self._stop_event.set()
+
+            # Let the event loop exit right away instead of after the cleanup
+            self._request_shutdown()
 
             # First, stop any active transcription mode
+            mode = self._mode
             try:
-                if self.current_mode == "longform" and "longform" in self.transcribers:
+                if mode == Mode.LONGFORM and self.transcribers.get("longform"):
                     safe_print("Stopping longform transcription...")
                     # Add a try-except block around stopping
                     try:
-                        self.transcribers["longform"].stop()
+                        # Discard the recording rather than transcribing it on exit
+                        self.transcribers["longform"].clean_up()
                     except Exception as e:
                         self.log_error(f"Error stopping longform transcription: {e}")
                     # Give it a moment to finish cleanup
                     time.sleep(0.5)
                 
-                if self.current_mode == "realtime" and "realtime" in self.transcribers:
+                if mode == Mode.REALTIME and self.transcribers.get("realtime"):
                     safe_print("Stopping realtime transcription...")
                     # Add a try-except block around stopping
                     try:
@@ -931,15 +1249,14 @@ class STTOrchestrator:
                     # Give it a moment to finish cleanup
                     time.sleep(0.5)
                     
-                if self.current_mode == "static" and "static" in self.transcribers:
+                if mode == Mode.STATIC and self.transcribers.get("static"):
                     safe_print("Stopping static transcription...")
                     # Add a try-except block around stopping
                     try:
-                        self.transcribers["static"].stop()
+                        # Already gives the transcription thread a moment to abort
+                        self.transcribers["static"].request_abort()
                     except Exception as e:
                         self.log_error(f"Error stopping static transcription: {e}")
-                    # Give it a moment to finish cleanup
-                    time.sleep(0.5)
             
             except Exception as e:
                 self.log_error(f"Error stopping active mode: {e}")
@@ -952,16 +1269,13 @@ class STTOrchestrator:
             # Stop the AutoHotkey script
             self.stop_ahk_script()
 
-            # Only try to join the server thread if we're not currently in it
-            current_thread_id = threading.get_ident()
-            server_thread_id = self.server_thread.ident if self.server_thread else None
-
+            # Drop any queued sessions; a running one has been stopped above
             try:
-                if (self.server_thread and self.server_thread.is_alive() and 
-                    current_thread_id != server_thread_id):
-                    self.server_thread.join(timeout=2)
-            except Exception as e:
-                self.log_error(f"Error joining server thread: {e}")
+                while True:
+                    self._sessions.get_nowait()
+            except queue.Empty:
+                pass
+            self._sessions.put(None)  # Let the worker exit
 
             # Clean up any remaining resources
             for module_type, transcriber in list(self.transcribers.items()):
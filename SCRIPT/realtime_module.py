@@ -1,6 +1,5 @@
 import os
 import sys
-import io
 import logging
 from typing import Callable, Optional, Union, List, Iterable
 import time
@@ -12,19 +11,33 @@ if os.name == "nt" and (3, 8) <= sys.version_info < (3, 99):
     _init_dll_path()
 
 # Fix console encoding for Windows to properly display Greek characters
-if os.name == "nt":
-    # Force UTF-8 encoding for stdout
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+if os.name == "nt" and hasattr(sys.stdout, "reconfigure"):
+    # Force UTF-8 encoding for stdout, keeping the existing stream
+    sys.stdout.reconfigure(encoding='utf-8')
 
 # Import Rich for better terminal display with Unicode support
 try:
     from rich.console import Console
     from rich.text import Text
+    from rich.live import Live
     console = Console()
     has_rich = True
 except ImportError:
     has_rich = False
 
+# A text() call that returns faster than this didn't wait for speech (e.g. the
+# recorder is shutting down), so the loop backs off instead of spinning
+MIN_LISTEN_TIME = 0.01
+IDLE_BACKOFF = 0.05
+MAX_ERROR_BACKOFF = 1.0
+
+# Upper bound on how often the interim line is redrawn
+MIN_INTERIM_REFRESH = 0.1
+
+# Constructor parameters that configure the transcriber itself rather than
+# the AudioToTextRecorder
+_LOCAL_PARAMS = frozenset({"self", "preinitialized_model", "preload_model"})
+
 class LongFormTranscriber:
     """
     A class that provides continuous speech-to-text transcription,
@@ -52,7 +65,7 @@ class LongFormTranscriber:
                  
                  # Voice Activation Parameters
                  silero_sensitivity: float = 0.4,
-                 silero_use_onnx: bool = False,
+                 silero_use_onnx: Optional[bool] = None,
                  silero_deactivity_detection: bool = False,
                  webrtc_sensitivity: int = 3,
                  post_speech_silence_duration: float = 0.6,
@@ -75,7 +88,8 @@ class LongFormTranscriber:
                  allowed_latency_limit: int = 100,
                  no_log_file: bool = True,
                  use_extended_logging: bool = False,
-                 beam_size_realtime: int = 3,
+                 beam_size_realtime: int = 1,
+                 use_main_model_for_realtime: bool = False,
                  enable_realtime_transcription: bool = False,
                  realtime_processing_pause: float = 0.05,
                  realtime_model_type: str = "tiny.en",
@@ -87,78 +101,75 @@ class LongFormTranscriber:
         """
         Initialize the transcriber with all available parameters.
         """
-        self.text_buffer = ""
+        # Every constructor parameter except our own options goes to the recorder
+        self.config = {k: v for k, v in locals().items() if k not in _LOCAL_PARAMS}
+
+        self.text_chunks = []  # Confirmed sentences, joined on demand
+        self._last_confirmed = ""
+        self._text_lock = threading.Lock()  # process_speech runs on recorder threads
         self.running = False
+        self._stop_evt = threading.Event()
         
         # Store preinitialized model if provided
         self.preinitialized_model = preinitialized_model
 
-        # Store constructor parameters
-        self.config = {
-            # General Parameters
-            'model': model,
-            'download_root': download_root,
-            'language': language,
-            'compute_type': compute_type,
-            'input_device_index': input_device_index,
-            'gpu_device_index': gpu_device_index,
-            'device': device,
-            'on_recording_start': on_recording_start,
-            'on_recording_stop': on_recording_stop,
-            'on_transcription_start': on_transcription_start,
-            'ensure_sentence_starting_uppercase': ensure_sentence_starting_uppercase,
-            'ensure_sentence_ends_with_period': ensure_sentence_ends_with_period,
-            'use_microphone': use_microphone,
-            'spinner': spinner,
-            'level': level,
-            'batch_size': batch_size,
-            
-            # Voice Activation Parameters
-            'silero_sensitivity': silero_sensitivity,
-            'silero_use_onnx': silero_use_onnx,
-            'silero_deactivity_detection': silero_deactivity_detection,
-            'webrtc_sensitivity': webrtc_sensitivity,
-            'post_speech_silence_duration': post_speech_silence_duration,
-            'min_length_of_recording': min_length_of_recording,
-            'min_gap_between_recordings': min_gap_between_recordings,
-            'pre_recording_buffer_duration': pre_recording_buffer_duration,
-            'on_vad_detect_start': on_vad_detect_start,
-            'on_vad_detect_stop': on_vad_detect_stop,
-            
-            # Advanced Parameters
-            'debug_mode': debug_mode,
-            'handle_buffer_overflow': handle_buffer_overflow,
-            'beam_size': beam_size,
-            'buffer_size': buffer_size,
-            'sample_rate': sample_rate,
-            'initial_prompt': initial_prompt,
-            'suppress_tokens': suppress_tokens,
-            'print_transcription_time': print_transcription_time,
-            'early_transcription_on_silence': early_transcription_on_silence,
-            'allowed_latency_limit': allowed_latency_limit,
-            'no_log_file': no_log_file,
-            'use_extended_logging': use_extended_logging,
-            
-            # Realtime specific parameters
-            'enable_realtime_transcription': True,
-            'realtime_processing_pause': 0.05,
-            'on_realtime_transcription_update': self._handle_realtime_update,
-        }
+        # Quantize by default: int8 weights with float16 activations on the GPU,
+        # plain int8 on the CPU
+        if compute_type == "default":
+            self.config['compute_type'] = "int8_float16" if device == "cuda" else "int8"
+
+        # Run Silero VAD on ONNX Runtime (CPU) when Whisper has the GPU, so the
+        # VAD doesn't compete with it on the same CUDA stream
+        if silero_use_onnx is None:
+            self.config['silero_use_onnx'] = device == "cuda"
+
+        # Small batches don't amortize the int8 kernel launches
+        self.config['batch_size'] = max(batch_size, 8)
+
+        self.config['on_realtime_transcription_update'] = (
+            self._handle_realtime_update if enable_realtime_transcription else None
+        )
+
+        # Interim line showing the hypothesis for the sentence being spoken
+        self._live = None
+        self._interim_text = ""
+        self._last_interim_refresh = 0.0
+        self._interim_flush = None  # Timer drawing the last throttled hypothesis
+        self._interim_lock = threading.Lock()
+        if enable_realtime_transcription and has_rich:
+            # Redrawn explicitly on each changed hypothesis rather than at a
+            # fixed rate; see _handle_realtime_update
+            self._live = Live(Text(""), console=console, transient=True, auto_refresh=False)
         
         # Lazy-loaded recorder
         self.recorder = None
         
         # Flag to track if the transcription model is initialized
         self.model_initialized = False
+
+        # Load the model in the background so start() doesn't pay for it
+        self._warm_thread = None
+        if preload_model:
+            self._warm_thread = threading.Thread(target=self._warmup, daemon=True)
+            self._warm_thread.start()
+
+    def _warmup(self):
+        """Create the recorder ahead of the first start() call."""
+        # The recorder runs a warm-up transcription while it initializes, so
+        # CUDA context creation and kernel selection happen here as well
+        self.model_initialized = self._initialize_recorder() is not None
+
+    def wait_for_warmup(self):
+        """Block until a background warm-up started by preload_model is done."""
+        if self._warm_thread is not None:
+            self._warm_thread.join()
+            self._warm_thread = None
     
     def _initialize_recorder(self):
         """Lazy initialization of the recorder."""
         if self.recorder is not None:
             return self.recorder  # Return the recorder if already initialized
         
-        # Force disable real-time preview functionality
-        self.config['enable_realtime_transcription'] = False
-        
         # No callbacks needed since we don't want to print anything
         # Remove the previous callbacks completely
         self.config['on_recording_start'] = None
@@ -194,9 +205,53 @@ class LongFormTranscriber:
     
     def _handle_realtime_update(self, text):
         """Handler for real-time transcription updates."""
-        # Silently receive updates but don't display them
-        # This prevents partial transcripts from being shown
-        pass
+        if not self._live:
+            return
+
+        # Compared and set under the lock process_speech clears the line with,
+        # so a late hypothesis can't slip in between
+        with self._interim_lock:
+            # Show the partial transcript until the sentence is confirmed; the
+            # hypothesis often repeats between ticks, so skip redundant redraws
+            if text == self._interim_text:
+                return
+            self._interim_text = text
+
+            # Always take the newest hypothesis, but coalesce bursts into at
+            # most one terminal redraw per MIN_INTERIM_REFRESH
+            now = time.monotonic()
+            wait = MIN_INTERIM_REFRESH - (now - self._last_interim_refresh)
+            if wait <= 0:
+                self._last_interim_refresh = now
+            self._live.update(Text(text, style="dim white"), refresh=wait <= 0)
+
+            # A skipped hypothesis may be the last one of the sentence, so
+            # make sure it gets drawn once the window has passed
+            if wait > 0 and self._interim_flush is None:
+                self._interim_flush = threading.Timer(wait, self._flush_interim)
+                self._interim_flush.daemon = True
+                self._interim_flush.start()
+
+    def _flush_interim(self):
+        """Draw the hypothesis held back by the refresh throttle."""
+        with self._interim_lock:
+            self._interim_flush = None
+            self._last_interim_refresh = time.monotonic()
+            if self._live:
+                self._live.refresh()
+
+    def _cancel_interim_flush(self):
+        """Drop a pending trailing redraw. Called with the interim lock held."""
+        if self._interim_flush is not None:
+            self._interim_flush.cancel()
+            self._interim_flush = None
+
+    def _clear_interim(self):
+        """Blank the interim line once its sentence has been confirmed."""
+        with self._interim_lock:
+            self._cancel_interim_flush()
+            self._interim_text = ""
+            self._live.update(Text(""), refresh=True)
                 
     def process_speech(self, text):
         """
@@ -205,16 +260,35 @@ class LongFormTranscriber:
         if text is None or not text.strip():
             return
 
-        # Display the complete transcription
-        if has_rich:
-            console.print(Text(text, style="bold cyan"))
-        else:
-            print(text)
+        # Each sentence arrives on its own thread; the lock keeps the duplicate
+        # check, the buffer and the console from interleaving or appending a
+        # sentence twice, but doesn't order the threads
+        with self._text_lock:
+            # The recorder occasionally hands over the same sentence twice
+            norm = text.strip()
+            if norm == self._last_confirmed:
+                return
+            self._last_confirmed = norm
+
+            self.text_chunks.append(text)
+
+            # Display the complete transcription
+            if has_rich:
+                console.print(Text(text, style="bold cyan"))
+            else:
+                print(text)
+
+            # The confirmed line replaces the interim one
+            if self._live:
+                self._clear_interim()
     
     def start(self):
         """
         Start the continuous transcription process.
         """
+        # Wait for a background warm-up to finish rather than racing it
+        self.wait_for_warmup()
+
         if not self._initialize_recorder():
             if has_rich:
                 console.print("[bold red]Failed to initialize the recorder. Cannot start transcription.[/bold red]")
@@ -223,25 +297,36 @@ class LongFormTranscriber:
             return
 
         self.running = True
+        self._stop_evt.clear()
 
         if has_rich:
             console.print("[bold green]Real-time transcription active[/bold green]")
         else:
             print("Real-time transcription active")
 
+        if self._live:
+            self._live.start()
+
         try:
-            while self.running:
+            error_backoff = 0.1
+            while self.running and not self._stop_evt.is_set():
                 try:
-                    # Listen for speech and transcribe it
-                    text_result = self.recorder.text()
-                    if text_result:
-                        self.process_speech(text_result)
+                    # Listen for speech and transcribe it; the recorder still
+                    # runs inference on this thread, only process_speech (the
+                    # dedup and printing) is handed off to a thread of its own
+                    started = time.monotonic()
+                    self.recorder.text(self.process_speech)
+                    error_backoff = 0.1
+                    if time.monotonic() - started < MIN_LISTEN_TIME:
+                        self._stop_evt.wait(IDLE_BACKOFF)
                 except Exception as e:
                     if has_rich:
                         console.print(f"[bold red]Error during transcription: {str(e)}[/bold red]")
                     else:
                         print(f"Error during transcription: {str(e)}")
-                    time.sleep(0.1)  # Brief pause before retrying
+                    # Back off exponentially while the recorder keeps failing
+                    self._stop_evt.wait(error_backoff)
+                    error_backoff = min(error_backoff * 2, MAX_ERROR_BACKOFF)
 
         except KeyboardInterrupt:
             # Handle graceful exit on Ctrl+C
@@ -257,6 +342,15 @@ class LongFormTranscriber:
         Stop the transcription process and clean up resources.
         """
         self.running = False
+        self._stop_evt.set()
+
+        if self._live:
+            with self._interim_lock:
+                self._cancel_interim_flush()
+            self._live.stop()
+
+        # Let a background warm-up finish so its recorder is shut down too
+        self.wait_for_warmup()
 
         if self.recorder:
             try:
@@ -284,7 +378,16 @@ class LongFormTranscriber:
         """
         Return the current transcribed text buffer.
         """
-        return self.text_buffer
+        with self._text_lock:
+            return " ".join(self.text_chunks)
+
+    def clear_transcribed_text(self):
+        """
+        Discard the text transcribed so far.
+        """
+        with self._text_lock:
+            self.text_chunks.clear()
+            self._last_confirmed = ""
 
 
 def main():
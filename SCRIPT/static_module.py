@@ -22,7 +22,7 @@ import wave
 import time
 import tempfile
 import ctypes
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Union
 import tkinter as tk
 from tkinter import filedialog
 
@@ -48,13 +48,20 @@ except ImportError:
 
 # Try to import required libraries, with graceful fallbacks
 try:
-    import torch
+    import numpy as np
+    import ctranslate2
     from faster_whisper import WhisperModel
     HAS_WHISPER = True
 except ImportError:
     HAS_WHISPER = False
     print("Warning: faster-whisper not installed. Install with: pip install faster-whisper")
 
+# Batched inference is only available in newer faster-whisper releases
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
 try:
     import webrtcvad
     HAS_WEBRTC_VAD = True
@@ -62,6 +69,10 @@ except ImportError:
     HAS_WEBRTC_VAD = False
     print("Warning: webrtcvad not installed. Install with: pip install webrtcvad")
 
+# Largest audio buffer kept between files (five minutes of 16kHz audio);
+# anything bigger is released once the file is done
+MAX_RETAINED_SAMPLES = 16000 * 60 * 5
+
 class DirectFileTranscriber:
     """
     A class that directly transcribes audio and video files using Faster Whisper,
@@ -77,6 +88,9 @@ class DirectFileTranscriber:
                  device: str = "cuda",
                  device_index: int = 0,
                  task: str = "transcribe",
+                 beam_size: int = 5,
+                 batch_size: int = 16,
+                 vad_aggressiveness: int = 2,
                  callback_on_progress: Optional[Callable[[str], None]] = None,
                  preinitialized_model=None,
                  **kwargs):
@@ -90,6 +104,9 @@ class DirectFileTranscriber:
         self.download_root = download_root
         self.use_tk_mainloop = use_tk_mainloop
         self.task = task
+        self.beam_size = beam_size
+        self.batch_size = batch_size
+        self.vad_aggressiveness = vad_aggressiveness
         self.callback_on_progress = callback_on_progress
 
         # Store preinitialized model if provided
@@ -98,17 +115,26 @@ class DirectFileTranscriber:
         # State variables
         self.transcribing = False
         self.abort_requested = False
+        self.done_event = threading.Event()  # Cleared while a file is being processed
+        self.done_event.set()
         self.transcription_thread = None
         self.root = None
         self.whisper_model = None
+        self._model_lock = threading.Lock()
+        self._model_thread = None
+        self._load_cancelled = threading.Event()  # Set by cleanup() to drop a pending load
         self.temp_dir = None
+        self._pcm_scratch = None  # Reused buffer for the voiced 16-bit PCM
+        self._f32_scratch = None  # Reused float32 buffer for the audio handed to Whisper
         
         # Create temporary directory
         self._setup_temp_dir()
         
-        # Preload model if possible
+        # Preload the model in the background, so the file dialog can open
+        # (and the user pick a file) while the weights load
         if HAS_WHISPER:
-            self._initialize_model()
+            self._model_thread = threading.Thread(target=self._initialize_model, daemon=True)
+            self._model_thread.start()
     
     def _safe_print(self, message: str, style: str = "default") -> None:
         """Print with Rich if available, otherwise use regular print."""
@@ -138,9 +164,22 @@ class DirectFileTranscriber:
             self.temp_dir = os.getcwd()
     
     def _initialize_model(self) -> bool:
-        """Initialize the Whisper model."""
+        """Initialize the Whisper model, loading it only once across threads."""
         if self.whisper_model is not None:
             return True
+
+        # A second caller waits for a load already in progress
+        with self._model_lock:
+            return self._load_model()
+
+    def _load_model(self) -> bool:
+        """Load the Whisper model. Called with the model lock held."""
+        if self.whisper_model is not None:
+            return True
+
+        # The transcriber has been cleaned up, so don't hold a model for it
+        if self._load_cancelled.is_set():
+            return False
             
         if not HAS_WHISPER:
             self._safe_print("Faster Whisper not installed. Cannot initialize model.", "error")
@@ -159,7 +198,9 @@ class DirectFileTranscriber:
             
             # Determine device
             device = self.device
-            if device == "cuda" and not torch.cuda.is_available():
+            # Ask CTranslate2 directly; importing torch just for this check
+            # would add seconds to the first static transcription
+            if device == "cuda" and ctranslate2.get_cuda_device_count() == 0:
                 self._safe_print("CUDA not available, falling back to CPU", "warning")
                 device = "cpu"
                 
@@ -169,16 +210,28 @@ class DirectFileTranscriber:
                 compute_type = "float32"
                 
             # Initialize the model
-            self.whisper_model = WhisperModel(
+            model = WhisperModel(
                 self.model_name,
                 device=device,
                 device_index=self.device_index,
                 compute_type=compute_type,
                 download_root=self.download_root
             )
+
+            # cleanup() may have run while the weights were loading; checked
+            # after the assignment, since cleanup() sets the flag first
+            self.whisper_model = model
+            del model
+            if self._load_cancelled.is_set():
+                self.whisper_model = None
+                logging.info("Model load cancelled, discarding the loaded model")
+                return False
             
             self._safe_print(f"Whisper model {self.model_name} loaded successfully", "success")
             logging.info(f"Model {self.model_name} initialized successfully")
+
+            if not self._load_cancelled.is_set():
+                self._warm_up_model()
             return True
             
         except Exception as e:
@@ -186,6 +239,22 @@ class DirectFileTranscriber:
             logging.error(f"Model initialization error: {e}")
             return False
     
+    def _warm_up_model(self) -> None:
+        """
+        Run one second of silence through the model, so the first real file
+        doesn't pay for CUDA kernel setup and lazy initialization.
+        """
+        try:
+            segments, _ = self.whisper_model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language=self.language,
+                beam_size=self.beam_size
+            )
+            list(segments)  # Segments are generated lazily; run the decoder too
+            logging.info("Whisper model warm-up complete")
+        except Exception as e:
+            logging.warning(f"Whisper model warm-up failed: {e}")
+
     def _cleanup_temp_files(self) -> None:
         """Clean up temporary files."""
         if self.temp_dir and os.path.exists(self.temp_dir):
@@ -225,6 +294,7 @@ class DirectFileTranscriber:
         if file_path:
             # Reset abort flag
             self.abort_requested = False
+            self.done_event.clear()
             
             # Start transcription in a separate thread
             self.transcription_thread = threading.Thread(
@@ -292,8 +362,13 @@ class DirectFileTranscriber:
             logging.error(f"FFmpeg conversion error: {e}")
             return None
     
-    def _apply_vad(self, in_wav_path: str, aggressiveness: int = 2) -> str:
-        """Apply Voice Activity Detection to keep only speech frames."""
+    def _apply_vad(self, in_wav_path: str, aggressiveness: int = 2) -> Union[str, "np.ndarray"]:
+        """
+        Apply Voice Activity Detection to keep only speech frames.
+
+        Returns the speech as a float32 array ready for Whisper, or a WAV
+        path when VAD was skipped or the audio isn't at Whisper's 16kHz.
+        """
         if not HAS_WEBRTC_VAD:
             self._safe_print("webrtcvad not installed. Skipping VAD.", "warning")
             return in_wav_path
@@ -305,6 +380,7 @@ class DirectFileTranscriber:
             wf_in = wave.open(in_wav_path, 'rb')
             channels = wf_in.getnchannels()
             rate = wf_in.getframerate()
+            sample_width = wf_in.getsampwidth()
             
             # Check if file format is compatible with VAD
             if channels != 1:
@@ -312,6 +388,11 @@ class DirectFileTranscriber:
                 wf_in.close()
                 return in_wav_path
                 
+            if sample_width != 2:
+                self._safe_print("VAD requires 16-bit audio. Skipping VAD.", "warning")
+                wf_in.close()
+                return in_wav_path
+
             if rate not in [8000, 16000, 32000, 48000]:
                 self._safe_print("VAD requires specific sample rates. Skipping VAD.", "warning")
                 wf_in.close()
@@ -328,7 +409,15 @@ class DirectFileTranscriber:
             frame_ms = 30
             frame_bytes = int(rate * 2 * (frame_ms/1000.0))  # 16-bit samples = 2 bytes each
             
-            voiced_bytes = bytearray()
+            # Frames are sliced as zero-copy views and voiced ones copied into a
+            # buffer at least the input size, so no per-frame objects or
+            # regrowth of the output; a buffer of moderate size is kept for
+            # the next file
+            audio_view = memoryview(audio_data)
+            if self._pcm_scratch is None or len(self._pcm_scratch) < len(audio_data):
+                self._pcm_scratch = bytearray(len(audio_data))
+            voiced_bytes = self._pcm_scratch
+            voiced_len = 0
             idx = 0
 
             # Process each frame
@@ -345,10 +434,11 @@ class DirectFileTranscriber:
                     self._safe_print("VAD processing aborted by user", "warning")
                     return in_wav_path
                     
-                frame = audio_data[idx:idx+frame_bytes]
+                frame = audio_view[idx:idx+frame_bytes]
                 is_speech = vad.is_speech(frame, rate)
                 if is_speech:
-                    voiced_bytes.extend(frame)
+                    voiced_bytes[voiced_len:voiced_len+frame_bytes] = frame
+                    voiced_len += frame_bytes
                     frames_speech += 1
                     
                 frames_processed += 1
@@ -361,19 +451,25 @@ class DirectFileTranscriber:
                 idx += frame_bytes
 
             # Check if we found any speech
-            if len(voiced_bytes) == 0:
+            if voiced_len == 0:
                 self._safe_print("VAD found no voice frames. Using original audio.", "warning")
                 return in_wav_path
 
+            self._safe_print(f"VAD processing complete: Retained {frames_speech} voice frames out of {frames_processed} total frames", "success")
+
+            # Hand the speech to Whisper in memory rather than writing a WAV
+            # that it would have to read and decode again
+            if rate == 16000:
+                return self._pcm16_to_float32(memoryview(voiced_bytes)[:voiced_len])
+
             # Write out the speech-only audio
             wf_out = wave.open(out_wav, 'wb')
             wf_out.setnchannels(1)
             wf_out.setsampwidth(2)  # 16-bit
             wf_out.setframerate(rate)
-            wf_out.writeframes(voiced_bytes)
+            wf_out.writeframes(memoryview(voiced_bytes)[:voiced_len])
             wf_out.close()
 
-            self._safe_print(f"VAD processing complete: Retained {frames_speech} voice frames out of {frames_processed} total frames", "success")
             return out_wav
             
         except Exception as e:
@@ -381,6 +477,28 @@ class DirectFileTranscriber:
             logging.error(f"VAD processing error: {e}")
             return in_wav_path
     
+    def _pcm16_to_float32(self, pcm) -> "np.ndarray":
+        """
+        Convert 16-bit PCM bytes to float32 samples in [-1, 1).
+
+        The result is a view into a scratch buffer that is reused across
+        files, so it's valid until the next conversion.
+        """
+        src = np.frombuffer(pcm, dtype=np.int16)
+        if self._f32_scratch is None or self._f32_scratch.size < src.size:
+            self._f32_scratch = np.empty(src.size, dtype=np.float32)
+        dst = self._f32_scratch[:src.size]
+        # Scale straight into the destination: one pass, no temporaries
+        np.multiply(src, np.float32(1.0 / 32768.0), out=dst)
+        return dst
+
+    def _release_scratch(self) -> None:
+        """Drop scratch buffers too large to keep around between files."""
+        if self._pcm_scratch is not None and len(self._pcm_scratch) > 2 * MAX_RETAINED_SAMPLES:
+            self._pcm_scratch = None  # 16-bit, two bytes per sample
+        if self._f32_scratch is not None and self._f32_scratch.size > MAX_RETAINED_SAMPLES:
+            self._f32_scratch = None
+
     def _update_progress(self, message: str) -> None:
         """Update progress message."""
         logging.info(message)
@@ -394,6 +512,11 @@ class DirectFileTranscriber:
             self.transcribing = True
             logging.info(f"Processing file: {file_path}")
             self._safe_print(f"Processing file: {os.path.basename(file_path)}", "info")
+
+            # The transcriber (and its model) is reused across files, but the
+            # previous file's cleanup removed the temporary directory
+            if not self.temp_dir or not os.path.exists(self.temp_dir):
+                self._setup_temp_dir()
             
             # Check if model is initialized
             if not self._initialize_model():
@@ -417,7 +540,7 @@ class DirectFileTranscriber:
             
             # Step 2: Apply VAD to remove non-speech sections
             self._update_progress("Applying Voice Activity Detection...")
-            voice_wav = self._apply_vad(wav_path, aggressiveness=2)
+            voice_audio = self._apply_vad(wav_path, aggressiveness=self.vad_aggressiveness)
             
             # Check abort flag after VAD
             if self.abort_requested:
@@ -438,12 +561,24 @@ class DirectFileTranscriber:
                 self._safe_print(f"Language '{self.language}' - using transcription mode", "info")
                 
             try:
-                segments, info = self.whisper_model.transcribe(
-                    voice_wav,
-                    language=self.language,
-                    task=task,
-                    beam_size=5
-                )
+                if BatchedInferencePipeline is not None and self.batch_size > 1:
+                    # Split the speech into chunks of up to 30s at pauses and
+                    # decode them batch_size at a time instead of one long pass
+                    pipeline = BatchedInferencePipeline(model=self.whisper_model)
+                    segments, info = pipeline.transcribe(
+                        voice_audio,
+                        language=self.language,
+                        task=task,
+                        beam_size=self.beam_size,
+                        batch_size=self.batch_size
+                    )
+                else:
+                    segments, info = self.whisper_model.transcribe(
+                        voice_audio,
+                        language=self.language,
+                        task=task,
+                        beam_size=self.beam_size
+                    )
                 
                 # Combine all segments into final text
                 final_text = ""
@@ -507,8 +642,10 @@ class DirectFileTranscriber:
         
         finally:
             self._cleanup_temp_files()
+            self._release_scratch()
             self.transcribing = False
             self._safe_print("Transcription process complete", "success")
+            self.done_event.set()
     
     def request_abort(self) -> None:
         """Request abortion of any in-progress transcription."""
@@ -522,8 +659,8 @@ class DirectFileTranscriber:
         # Try to terminate the thread if it's stuck
         if self.transcription_thread and self.transcription_thread.is_alive():
             try:
-                # Give it a moment to abort gracefully
-                time.sleep(0.5)
+                # Give it a moment to abort gracefully, returning as soon as it does
+                self.transcription_thread.join(timeout=0.5)
                 
                 # If still running, try to terminate it (Windows-specific)
                 if self.transcription_thread.is_alive() and sys.platform == "win32":
@@ -548,9 +685,19 @@ class DirectFileTranscriber:
         # Request abort if transcription is in progress
         if self.transcribing:
             self.request_abort()
+
+        # Make a background model load drop its model once it finishes; not
+        # waited for, so unloading doesn't block on a load or download
+        self._load_cancelled.set()
+        self._model_thread = None
+        self.whisper_model = None
             
         # Clean up temp files
         self._cleanup_temp_files()
+
+        # Release the audio buffers, which are as large as the longest file
+        self._pcm_scratch = None
+        self._f32_scratch = None
         
         # Clean up Tkinter resources
         if self.root: